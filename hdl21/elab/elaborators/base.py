@@ -5,8 +5,9 @@
 
 # Std-Lib Imports
 import sys
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Container, Dict, List, Optional, Set, Tuple, Union
 
 # Local imports
 from ...module import Module
@@ -25,6 +26,36 @@ from ..context import Context
 ElabStackEntry = Union[GeneratorCall, Module, Instance, InstanceArray, InstanceBundle]
 
 
+# Sentinel for cache-misses in `Elaborator.modules`, the values of which can be `None`
+_NOT_CACHED = object()
+
+
+class _Finish:
+    """Work-stack entry for deferred post-order work, run after a Module expanded from an instance-target is elaborated.
+    E.g. naming and caching the result of a `GeneratorCall`."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], object]):
+        self.func = func
+
+
+def _children(module: Module) -> Tuple[Union[_Instance, BundleInstance], ...]:
+    """Snapshot the children of `module` traversed by elaboration, in order:
+    instances, arrays, instance bundles, and then bundle instances.
+
+    Note this is a snapshot taken once per visit, and not cached on the `Module`.
+    Elaboration passes regularly add and remove these children, e.g. when flattening arrays and bundles."""
+    return tuple(
+        chain(
+            module.instances.values(),
+            module.instarrays.values(),
+            module.instbundles.values(),
+            module.bundles.values(),
+        )
+    )
+
+
 class Elaborator:
     """
     # Base Elaborator Class
@@ -52,6 +83,16 @@ class Elaborator:
         self.tops = tops
         self.ctx = ctx
         self.stack: List[ElabStackEntry] = list()
+        # Per-pass cache of elaborated Modules, keyed by `id(module)`
+        self.modules: Dict[int, Module] = dict()
+        # IDs of Modules whose elaboration is in progress, used to detect recursive instantiation
+        self.pending: Set[int] = set()
+        # Instance-target elaboration methods, keyed by target type
+        self.dispatch: Dict[type, Callable[[Instantiable], Instantiable]] = {
+            Module: self.elaborate_module_base,  # Note `_base` here!
+            PrimitiveCall: self.elaborate_primitive_call,
+            ExternalModuleCall: self.elaborate_external_module,
+        }
 
     def elaborate_tops(self) -> List[Elaboratable]:
         """Elaborate our top nodes"""
@@ -86,31 +127,82 @@ class Elaborator:
         This requires that sub-classes also carefully audit when they call their own
         `elaborate_module` method. Generally, they should not, and should always call
         `elaborate_module_base` instead.
+
+        The hierarchy is traversed with an explicit work-stack rather than by recursion,
+        so that deep hierarchies neither pay a Python call-frame per level nor hit the recursion limit.
+        Each work-stack entry is a pair of (node, exiting), where `exiting` indicates the node's
+        children have all been visited and its post-order work is ready to run.
+        Instance-targets which expand into Modules, e.g. `GeneratorCall`s, join the same work-stack via `expand_instantiable`.
         """
 
-        # Check if this has already been elaborated
+        # Check if this has already been elaborated, either in a prior pass or earlier in this one.
+        # Note cached results can be `None`, for passes whose `elaborate_module` returns nothing.
         if module._elaborated is not None:
             return module._elaborated
+        modules = self.modules
+        cached = modules.get(id(module), _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+
+        # Bind the attributes and methods used in the loop below to locals.
+        # This is the innermost loop of every pass, run once per hierarchical node.
+        pending = self.pending
+        stack = self.stack
+        elaborate_module = self.elaborate_module
+        elaborate_bundle_instance = self.elaborate_bundle_instance
+        elaborate_instantiable = self.elaborate_instantiable
+        enter_instance = self._enter_instance
+        expand_instantiable = self.expand_instantiable
+
+        result = None
+        todo: List[Tuple[ElabStackEntry, bool]] = [(module, False)]
+        todo_pop, todo_push = todo.pop, todo.append
+        while todo:
+            node, exiting = todo_pop()
+
+            if exiting:
+                if isinstance(node, Module):
+                    # All children are done. Run the pass-specific `elaborate_module`, and cache its result.
+                    result = elaborate_module(node)
+                    modules[id(node)] = result
+                    pending.discard(id(node))
+                elif isinstance(node, _Finish):
+                    node.func()
+                    continue  # Manages its own hierarchy-stack entries
+                # Pop the hierarchy-stack, for both Modules and Instances
+                stack.pop()
+
+            elif isinstance(node, Module):
+                if node._elaborated is not None or id(node) in modules:
+                    continue  # Already done
+                if id(node) in pending:
+                    self.fail(f"Module {node.name} recursively instantiates itself")
+                pending.add(id(node))
+                stack.append(node)
+                todo_push((node, True))
+
+                # Push the Module's children in reverse, so that they pop in definition order.
+                todo.extend((child, False) for child in reversed(_children(node)))
+
+            elif isinstance(node, BundleInstance):
+                elaborate_bundle_instance(node)
+
+            else:  # Instance, Array, or Bundle thereof
+                target = enter_instance(node)
+                todo_push((node, True))
+                # Module targets join the work-stack, as do those which expand into Modules.
+                # Anything else is handled in a single call.
+                if isinstance(target, Module):
+                    todo_push((target, False))
+                    continue
+                expansion = expand_instantiable(target)
+                if expansion is None:
+                    elaborate_instantiable(target)
+                else:
+                    expanded, finish = expansion
+                    todo_push((_Finish(finish), True))
+                    todo_push((expanded, False))
 
-        self.stack.append(module)
-
-        # Depth-first traverse instances, ensuring their targets are defined
-        for inst in module.instances.values():
-            self.elaborate_instance_base(inst)
-        for arr in module.instarrays.values():
-            self.elaborate_instance_base(arr)
-        for instbundle in module.instbundles.values():
-            self.elaborate_instance_base(instbundle)
-
-        # Traverse Bundle instances
-        for bundle in module.bundles.values():
-            self.elaborate_bundle_instance(bundle)
-
-        # Run the pass-specific `elaborate_module`
-        result = self.elaborate_module(module)
-
-        # Pop the hierarchy-stack and return it
-        self.stack.pop()
         return result
 
     def elaborate_module(self, module: Module) -> Module:
@@ -132,51 +224,82 @@ class Elaborator:
         return inst
 
     def elaborate_instance_base(self, inst: _Instance) -> Instantiable:
-        """Elaborate a Module Instance, Array or Bundle thereof."""
+        """Elaborate a Module Instance, Array or Bundle thereof, outside of the hierarchy traversal.
+        Note `elaborate_module_base` does not call this method; its per-pass extension point is `instance_target`."""
+
+        target = self._enter_instance(inst)
+        rv = self.elaborate_instantiable(target)
+        self.stack.pop()
+        return rv
+
+    def _enter_instance(self, inst: _Instance) -> Optional[Instantiable]:
+        """Push Instance-like `inst` onto the hierarchy stack, and return its target.
+        Shared between `elaborate_module_base` and `elaborate_instance_base`.
+        Callers are responsible for popping the stack when done."""
 
         self.stack.append(inst)
         # Turn off `PortRef` magic
         inst._elaborated = True
-        # And visit the Instance's target
-        rv = self.elaborate_instantiable(inst._resolved)
-        self.stack.pop()
-        return rv
+        return self.instance_target(inst)
+
+    def expand_instantiable(
+        self, of: Instantiable
+    ) -> Optional[Tuple[Module, Callable[[], object]]]:
+        """Expand non-`Module` instance-target `of` into a `Module` to be traversed by `elaborate_module_base`.
+        Returns a pair of (module, finish), where `finish` is called after `module` is elaborated,
+        or `None` to elaborate `of` in a single call to `elaborate_instantiable`, the default.
+        Overridden by the Generator-elaborator, so that generated hierarchies do not recurse."""
+        return None
+
+    def instance_target(self, inst: _Instance) -> Optional[Instantiable]:
+        """Get the target to be elaborated for Instance-like `inst`.
+        Most passes operate on the *resolved* target, `inst._resolved`.
+        The Generator-elaborator is different, and overrides it.
+        This is the extension point for both `elaborate_module_base` and `elaborate_instance_base`."""
+        return inst._resolved
 
     def elaborate_instantiable(self, of: Instantiable) -> Instantiable:
-        # This version of `elaborate_instantiable` is the "post-generators" version used by *most* passes.
-        # The Generator-elaborator is different, and overrides it.
+        # Dispatch on the type of `of`, via the `dispatch` table.
+        # Most passes use the "post-generators" version set up in `__init__`.
+        # The Generator-elaborator is different, and adds `GeneratorCall`s to it.
         if not of:
             self.fail(f"Error elaborating undefined Instance-target {of}")
-        if isinstance(of, Module):
-            return self.elaborate_module_base(of)  # Note `_base` here!
-        if isinstance(of, PrimitiveCall):
-            return self.elaborate_primitive_call(of)
-        if isinstance(of, ExternalModuleCall):
-            return self.elaborate_external_module(of)
+        handler = self.dispatch.get(type(of), None)
+        if handler is not None:
+            return handler(of)
+        # Not an exact type-match. Check for sub-classes of each type.
+        for tp, handler in self.dispatch.items():
+            if isinstance(of, tp):
+                return handler(of)
         raise TypeError
 
     def flatname(
-        self, segments: List[str], *, avoid: Optional[Dict] = None, maxlen: int = 511
+        self,
+        segments: List[str],
+        *,
+        avoid: Optional[Container[str]] = None,
+        maxlen: int = 511,
     ) -> str:
-        """Create a attribute-name merging string-list `segments`, while avoiding all keys in dictionary `avoid`.
+        """Create a attribute-name merging string-list `segments`, while avoiding all keys in `avoid`.
+        `avoid` is generally a dictionary (e.g. a `Module.namespace`), but may be any container of strings, such as a `set`.
         Commonly re-used while flattening  nested objects and while creating explicit attributes from implicit ones.
         Raises a `RunTimeError` if no such name can be found of length less than `maxlen`.
         The default max-length is 511 characters, a value representative of typical limits in target EDA formats."""
 
-        if avoid is None:
-            avoid = {}
-
         # The default format and result is of the form "seg0_seg1".
-        # If that is in the avoid-keys, append underscores until it's not, or fails.
         name = "_".join(segments)
-        while True:
-            if len(name) > maxlen:
-                msg = f"Could not generate a flattened name for {segments}: (trying {name})"
-                self.fail(msg)
-            if name not in avoid:  # Done!
-                break
-            name += "_"  # Collision; append underscore
-        return name
+        if len(name) <= maxlen and (avoid is None or name not in avoid):
+            return name  # No collision, the common case. Done!
+
+        # Collision. Append underscores until it's not, or fails.
+        if avoid is not None:
+            for num in range(1, maxlen - len(name) + 1):
+                candidate = name + "_" * num
+                if candidate not in avoid:
+                    return candidate
+
+        msg = f"Could not generate a flattened name for {segments}: (trying {name})"
+        self.fail(msg)
 
     def fail(self, msg: str):
         """Error helper, adding stack and state info to an error"""
@@ -2,7 +2,8 @@
 # Generator Elaborator 
 """
 
-from typing import List, Dict, Union
+from functools import partial
+from typing import Callable, List, Dict, Optional, Tuple, Union
 
 # Local imports
 from ...module import Module
@@ -10,6 +11,7 @@ from ...instance import Instance
 from ...generator import GeneratorCall
 from ...params import HasNoParams, _unique_name
 from ...instantiable import Instantiable
+from ..context import Context
 
 # Import the base class
 from .base import Elaborator
@@ -37,6 +39,11 @@ class GeneratorElaborator(Elaborator):
     and `GeneratorElaborator`'s special-ish case is left to over-ride it.
     """
 
+    def __init__(self, tops: List[Union[Module, GeneratorCall]], ctx: Context):
+        super().__init__(tops, ctx)
+        # Add the capacity to call `GeneratorCall`s to the more-common base-case.
+        self.dispatch[GeneratorCall] = self.elaborate_generator_call
+
     def elaborate_tops(self) -> List[Module]:
         """Elaborate our top nodes"""
         if not isinstance(self.tops, List):
@@ -57,6 +64,27 @@ class GeneratorElaborator(Elaborator):
 
     def elaborate_generator_call(self, call: GeneratorCall) -> Module:
         """Elaborate Generator-function-call `call`. Returns the generated Module."""
+        m = self.run_generator_call(call)
+        if m is None:
+            return call.result  # Cached
+        self.elaborate_module_base(m)  # Note the `_base` here!
+        return self.finish_generator_call(call, m)
+
+    def expand_instantiable(
+        self, of: Instantiable
+    ) -> Optional[Tuple[Module, Callable[[], Module]]]:
+        """Expand `GeneratorCall`s into their generated Modules, for traversal on `elaborate_module_base`'s work-stack."""
+        if not isinstance(of, GeneratorCall):
+            return None
+        m = self.run_generator_call(of)
+        if m is None:
+            return None  # Cached. Elaborated in a single call.
+        return m, partial(self.finish_generator_call, of, m)
+
+    def run_generator_call(self, call: GeneratorCall) -> Optional[Module]:
+        """Run the Generator-function for `call`, the first half of `elaborate_generator_call`.
+        Returns the generated Module, which must be elaborated and then passed to `finish_generator_call`.
+        Returns `None` if `call` requires no further elaboration, i.e. it is cached, or has resolved to another `GeneratorCall`."""
 
         # First and foremost - caching.
         # See if we've already run this generator-parameters combo.
@@ -69,7 +97,7 @@ class GeneratorElaborator(Elaborator):
                 msg = f"GeneratorCall {call} has two different results: {call.result} and {cached_result}"
                 self.fail(msg)
             call.result = cached_result
-            return call.result
+            return None
 
         # Add both the `Call` and `Generator` to our stack.
         self.stack.append(call)
@@ -92,30 +120,39 @@ class GeneratorElaborator(Elaborator):
         if isinstance(m, Module):
             # Give the result a reference back to the generating `Call`
             m._generated_by = call
-
-            # And elaborate the module
-            m = self.elaborate_module_base(m)  # Note the `_base` here!
-
-            # If the Module that comes back is anonymous, start by giving it a name equal to the Generator's
-            if m.name is None:
-                m.name = call.gen.func.__name__
-
-            # Then add a unique suffix per its parameter-values
-            # Note this part may require that `m` has been through elaboration above!
-            if not isinstance(call.params, HasNoParams):
-                m.name += "(" + _unique_name(call.params) + ")"
+            return m
 
         # Generators may return other (potentially nested) generator-calls; recursively unwind any of them
         # Note this should hit Python's recursive stack-check if it doesn't terminate
-        elif isinstance(m, GeneratorCall):
+        if isinstance(m, GeneratorCall):
             m._generated_by = call
-            m: Module = self.elaborate_generator_call(m)
+            self.store_generator_result(call, self.elaborate_generator_call(m))
+            return None
 
         # Type-check the result.
         # Ultimately they've gotta resolve to Modules, or they fail.
-        else:
-            msg = f"Generator {call.gen.func.__name__} returned {type(m)}, must return Module."
-            self.fail(msg)
+        msg = f"Generator {call.gen.func.__name__} returned {type(m)}, must return Module."
+        self.fail(msg)
+
+    def finish_generator_call(self, call: GeneratorCall, m: Module) -> Module:
+        """Name and cache generated Module `m`, after its elaboration. The second half of `elaborate_generator_call`."""
+
+        # Get the elaborated Module. Note this is a cache-hit.
+        m = self.elaborate_module_base(m)  # Note the `_base` here!
+
+        # If the Module that comes back is anonymous, start by giving it a name equal to the Generator's
+        if m.name is None:
+            m.name = call.gen.func.__name__
+
+        # Then add a unique suffix per its parameter-values
+        # Note this part may require that `m` has been through elaboration above!
+        if not isinstance(call.params, HasNoParams):
+            m.name += "(" + _unique_name(call.params) + ")"
+
+        return self.store_generator_result(call, m)
+
+    def store_generator_result(self, call: GeneratorCall, m: Module) -> Module:
+        """Store the result `m` of `call`, and pop it off the stack."""
 
         # Store the result in our cache, and on the Call.
         call.result = m
@@ -128,21 +165,8 @@ class GeneratorElaborator(Elaborator):
         # And return the generated Module
         return m
 
-    def elaborate_instance_base(self, inst: Instance) -> Instantiable:
-        """Elaborate a Module Instance."""
+    def instance_target(self, inst: Instance) -> Instantiable:
+        """Get the target to be elaborated for Instance-like `inst`."""
         # This version differs from `Elaborator` in operating on the *unresolved* attribute `inst.of`,
         # instead of the resolved version `inst._resolved`.
-
-        self.stack.append(inst)
-        # Turn off `PortRef` magic
-        inst._elaborated = True
-        # And visit the Instance's target
-        rv = self.elaborate_instantiable(inst.of)
-        self.stack.pop()
-        return rv
-
-    def elaborate_instantiable(self, of: Instantiable) -> Instantiable:
-        """Elaborate an Instance target. Adds the capacity to call `GeneratorCall`s to the more-common base-case."""
-        if isinstance(of, GeneratorCall):
-            return self.elaborate_generator_call(call=of)
-        return super().elaborate_instantiable(of)
+        return inst.of
@@ -63,7 +63,7 @@ Summary of the content of the primitive library:
 import copy
 from enum import Enum
 from dataclasses import replace
-from typing import Optional, Any, List, Type, Dict
+from typing import Optional, Any, List, Tuple, Type, Dict
 
 # PyPi Imports
 from pydantic.dataclasses import dataclass
@@ -91,6 +91,9 @@ class Primitive:
     Primitives are leaf-level Modules typically defined not by users,
     but by simulation tools or device fabricators.
     Prominent examples include MOS transistors, diodes, resistors, and capacitors.
+
+    `ports` is cached from `port_list`, and shared between callers; treat it as read-only.
+    Re-assigning `port_list` is supported; mutating it in place, e.g. via `append`, is not reflected in `ports`.
     """
 
     name: str  # Primitive Name
@@ -110,6 +113,16 @@ class Primitive:
             if p.vis != Visibility.PORT:
                 msg = f"Invalid Primitive Port {p.name} on {self.name}; must have PORT visibility"
                 raise ValueError(msg)
+        self._build_ports()
+
+    def _build_ports(self) -> None:
+        """Build our `ports` dictionary once, as it is commonly accessed.
+        Stored alongside the `port_list` it was built from, to detect re-assignment."""
+        port_list = self.port_list
+        self._ports: Tuple[List[Signal], Dict[str, Signal]] = (
+            port_list,
+            {p.name: p for p in port_list},
+        )
 
     def __call__(self, arg: Any = Default, **kwargs) -> "PrimitiveCall":
         params = param_call(callee=self, arg=arg, **kwargs)
@@ -122,7 +135,12 @@ class Primitive:
 
     @property
     def ports(self) -> Dict[str, Signal]:
-        return {p.name: p for p in self.port_list}
+        port_list, ports = self._ports
+        if port_list is not self.port_list:
+            # `port_list` has been re-assigned. Rebuild.
+            self._build_ports()
+            ports = self._ports[1]
+        return ports
 
     def __eq__(self, other) -> bool:
         # Identity is equality
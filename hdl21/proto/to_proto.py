@@ -14,7 +14,8 @@ free-standing functions to enable use elsewhere.
 from decimal import Decimal
 from dataclasses import fields
 from enum import Enum
-from typing import Optional, List, Union, Dict, Any
+from itertools import chain
+from typing import Optional, List, Union, Dict, Any, Callable, Tuple
 
 from pydantic.dataclasses import dataclass
 
@@ -57,6 +58,22 @@ def to_proto(
     return exporter.export()
 
 
+# Mapping from `IDEAL` primitive names to their `vlsir.primitives` equivalents
+_IDEAL_PRIMITIVE_NAMES: Dict[str, str] = {
+    "DcVoltageSource": "vdc",
+    "PulseVoltageSource": "vpulse",
+    "SineVoltageSource": "vsin",
+    "CurrentSource": "isource",
+    "IdealResistor": "resistor",
+    "IdealCapacitor": "capacitor",
+    "IdealInductor": "inductor",
+    "VoltageControlledVoltageSource": "vcvs",
+    "CurrentControlledVoltageSource": "ccvs",
+    "VoltageControlledCurrentSource": "vccs",
+    "CurrentControlledCurrentSource": "cccs",
+}
+
+
 @dataclass
 class ModuleMapping:
     hmod: Module  # hdl21.Module
@@ -81,6 +98,12 @@ class ProtoExporter:
         # ExternalModule-id to Proto-ExternalModule dict
         self.ext_modules: Dict[int, vckt.ExternalModule] = dict()
 
+        # Exported connection-targets, keyed by `export_conn_target`
+        self.conn_targets: Dict[tuple, vckt.ConnectionTarget] = dict()
+
+        # Exported instance-parameters, keyed by (id(params), conversion function)
+        self.params_cache: Dict[Tuple[Any, Callable], List[vlsir.Param]] = dict()
+
         # Default `domain` AKA package-name is the empty string
         self.pkg = vckt.Package(domain=domain or "")
 
@@ -102,9 +125,9 @@ class ProtoExporter:
 
         mname = module_qualname(module)
 
-        if mname in self.modules_by_name:
-            conflict = self.modules_by_name[mname].hmod
-            msg = f"Cannot serialize Module {module} due to conflicting name with {conflict}. \n"
+        conflict = self.modules_by_name.get(mname, None)
+        if conflict is not None:
+            msg = f"Cannot serialize Module {module} due to conflicting name with {conflict.hmod}. \n"
             msg += "(Was this a generator that didn't get decorated with `@hdl21.generator`?) "
             raise RuntimeError(msg)
         return mname
@@ -119,28 +142,33 @@ class ProtoExporter:
             msg = f"Invalid attribute for Proto export: Module {module.name} with Bundles {list(module.bundles.keys())}"
             raise RuntimeError(msg)
 
-        # Create the Proto-Module
-        pmod = vckt.Module()
-
         # Create its serialized name
-        pmod.name = self.export_module_name(module)
+        name = self.export_module_name(module)
 
         # Create its Signal-objects, which include the hdl21.Module's Ports
-        for sig in list(module.signals.values()) + list(module.ports.values()):
-            psig = vckt.Signal(name=sig.name, width=sig.width)
-            pmod.signals.append(psig)
+        psignals = [
+            vckt.Signal(name=sig.name, width=sig.width)
+            for sig in chain(module.signals.values(), module.ports.values())
+        ]
 
         # Create its Port-objects
-        for port in module.ports.values():
-            pmod.ports.append(export_port(port))
-
-        # Create each Proto-Instance
-        for inst in module.instances.values():
-            if not inst._resolved:
-                msg = f"Invalid Instance {inst.name} of unresolved Module in Module {module.name}"
-                raise RuntimeError(msg)
-            pinst = self.export_instance(inst)
-            pmod.instances.append(pinst)
+        pports = [export_port(port) for port in module.ports.values()]
+
+        # Create each Proto-Instance.
+        # Leaf Modules, commonly the majority in large designs, skip this entirely.
+        pinstances = []
+        if module.instances:
+            export_instance = self.export_instance
+            for inst in module.instances.values():
+                if not inst._resolved:
+                    msg = f"Invalid Instance {inst.name} of unresolved Module in Module {module.name}"
+                    raise RuntimeError(msg)
+                pinstances.append(export_instance(inst))
+
+        # Create the Proto-Module, in a single constructor call
+        pmod = vckt.Module(
+            name=name, signals=psignals, ports=pports, instances=pinstances
+        )
 
         # Create the Module's `literal`s
         # FIXME: https://github.com/dan-fritchman/Hdl21/issues/149
@@ -179,15 +207,21 @@ class ProtoExporter:
         Depth-first retrieves a Module definition first,
         using its generated `name` field as the Instance's `module` pointer."""
 
-        # Create the Proto-Instance
-        pinst = vckt.Instance(name=inst.name)
+        # Exported parameters, which remain empty for Module instances
+        vparams: List[vlsir.Param] = []
 
         # First depth-first seek out our definition,
         # Retrieving the data we need to make a `Reference` to it
         if isinstance(inst._resolved, Module):
-            pmod = self.export_module(inst._resolved)
+            # Check our Module-cache here, skipping the call to `export_module` for Modules which are already done.
+            # Shared leaf-cells are commonly instantiated many, many times.
+            mapping = self.modules_by_id.get(id(inst._resolved), None)
+            if mapping is not None:
+                pmod = mapping.pmod
+            else:
+                pmod = self.export_module(inst._resolved)
             # Give it a Reference to its Module
-            pinst.module.local = pmod.name
+            ref = vlsir.utils.Reference(local=pmod.name)
         elif isinstance(inst._resolved, (PrimitiveCall, ExternalModuleCall)):
             call = inst._resolved
 
@@ -195,85 +229,123 @@ class ProtoExporter:
                 # Create a reference to one of the `primitive` namespaces
                 if call.prim.primtype == PrimitiveType.PHYSICAL:
                     # FIXME: #54 also expose the `hdl21.primitives` as a VLSIR package
-                    pinst.module.external.domain = "hdl21.primitives"
-                    pinst.module.external.name = call.prim.name
-                    params = dictify_params(call.params)
+                    qname = vlsir.utils.QualifiedName(
+                        domain="hdl21.primitives", name=call.prim.name
+                    )
+                    to_dict = dictify_params
                 elif call.prim.primtype == PrimitiveType.IDEAL:
                     # Ideal elements convert to `vlsir.primitives`
-                    pinst.module.external.domain = "vlsir.primitives"
-                    prim_map = {
-                        "DcVoltageSource": "vdc",
-                        "PulseVoltageSource": "vpulse",
-                        "SineVoltageSource": "vsin",
-                        "CurrentSource": "isource",
-                        "IdealResistor": "resistor",
-                        "IdealCapacitor": "capacitor",
-                        "IdealInductor": "inductor",
-                        "VoltageControlledVoltageSource": "vcvs",
-                        "CurrentControlledVoltageSource": "ccvs",
-                        "VoltageControlledCurrentSource": "vccs",
-                        "CurrentControlledCurrentSource": "cccs",
-                    }
-                    if call.prim.name not in prim_map:
+                    vlsir_name = _IDEAL_PRIMITIVE_NAMES.get(call.prim.name, None)
+                    if vlsir_name is None:
                         msg = f"Invalid Primitive {call.prim.name} in PrimitiveCall {inst.name}"
                         raise RuntimeError(msg)
-                    pinst.module.external.name = prim_map[call.prim.name]
-                    params = export_primitive_params(call.params)
+                    qname = vlsir.utils.QualifiedName(
+                        domain="vlsir.primitives", name=vlsir_name
+                    )
+                    to_dict = export_primitive_params
                 else:
                     raise ValueError(f"Invalid PrimitiveType {call.prim.primtype}")
 
             elif isinstance(inst._resolved, ExternalModuleCall):
-                self.export_external_module(call.module)
-                pinst.module.external.domain = call.module.domain or ""
-                pinst.module.external.name = call.module.name
-                params = dictify_params(call.params)
+                if id(call.module) not in self.ext_modules:
+                    self.export_external_module(call.module)
+                qname = vlsir.utils.QualifiedName(
+                    domain=call.module.domain or "", name=call.module.name
+                )
+                to_dict = dictify_params
 
             else:
                 msg = f"Un-exportable Instance {inst} resolves to invalid type {inst._resolved}"
                 raise TypeError(msg)
 
-            # Export the instance parameters
-            for key, val in params.items():
-                if val is None:
-                    continue  # None-valued parameters go un-set
-                # Otherwise export and copy it into place
-                vparam = vlsir.Param(name=key, value=export_param_value(val))
-                pinst.parameters.append(vparam)
+            # Give it a Reference to its external definition, and export its parameters
+            ref = vlsir.utils.Reference(external=qname)
+            vparams = self.export_params(call.params, to_dict)
 
         else:
             raise TypeError(f"Un-exportable Instance {inst} of {inst._resolved}")
 
-        # Create its connections mapping
-        for pname, conn in inst.conns.items():
-            # Assign each item into the connections dict.
-            # The proto interface requires copying it along the way
-            pconn = vckt.Connection(
-                portname=pname, target=export_connection_target(conn)
-            )
-            pinst.connections.append(pconn)
+        # Create its connections. Bind the names used per-connection to locals first.
+        Connection, export_conn_target = vckt.Connection, self.export_conn_target
+        pconns = [
+            Connection(portname=pname, target=export_conn_target(conn))
+            for pname, conn in inst.conns.items()
+        ]
+
+        # And create the Proto-Instance, in a single constructor call
+        return vckt.Instance(
+            name=inst.name, module=ref, parameters=vparams, connections=pconns
+        )
 
-        return pinst
+    def export_conn_target(
+        self, conn: Union[Signal, Slice, Concat]
+    ) -> vckt.ConnectionTarget:
+        """Export a proto `ConnectionTarget`, re-using those for repeated connections to the same `Signal` or `Slice`.
+        Shared nets such as power and ground are commonly connected to a large fraction of all instance ports.
+        `Concat`s are rarely repeated, and are exported fresh each time."""
+
+        if isinstance(conn, Signal):
+            key = (Signal, id(conn))
+        elif isinstance(conn, Slice):
+            key = (Slice, id(conn.parent), conn.top, conn.bot, conn.step)
+        else:
+            return export_connection_target(conn)
+
+        cached = self.conn_targets.get(key, None)
+        if cached is None:
+            cached = self.conn_targets[key] = export_connection_target(conn)
+        return cached
+
+    def export_params(
+        self, params: Any, to_dict: Callable[[Any], Dict[str, Any]]
+    ) -> List[vlsir.Param]:
+        """Export instance-parameters `params`, using function `to_dict` to convert them into a name-value dictionary.
+        Results for (immutable, hashable) `paramclass` values are cached by value, as large designs commonly share
+        equal parameter-values across many instances, e.g. thousands of identically-sized transistors."""
+
+        # Only cache paramclass values. Dictionaries are mutable, and can change between instances.
+        key = None
+        if isparamclass(params):
+            key = (params, to_dict)
+            try:
+                cached = self.params_cache.get(key, None)
+            except TypeError:  # Un-hashable field values
+                key = cached = None
+            if cached is not None:
+                return cached
+
+        vparams = []
+        for name, val in to_dict(params).items():
+            if val is None:
+                continue  # None-valued parameters go un-set
+            # Otherwise export and copy it into place
+            vparams.append(vlsir.Param(name=name, value=export_param_value(val)))
+
+        if key is not None:
+            self.params_cache[key] = vparams
+        return vparams
 
 
 def export_port(port: Port) -> vckt.Port:
     """Export a `Port`"""
-    pport = vckt.Port()
-    pport.direction = export_port_dir(port)
-    pport.signal = port.name
-    return pport
+    return vckt.Port(direction=export_port_dir(port), signal=port.name)
+
+
+# Mapping from `PortDir` to its VLSIR equivalent
+_PORTDIR_MAP: Dict[PortDir, vckt.Port.Direction] = {
+    PortDir.INPUT: vckt.Port.Direction.INPUT,
+    PortDir.OUTPUT: vckt.Port.Direction.OUTPUT,
+    PortDir.INOUT: vckt.Port.Direction.INOUT,
+    PortDir.NONE: vckt.Port.Direction.NONE,
+}
 
 
 def export_port_dir(port: Port) -> vckt.Port.Direction:
     """Convert between Port-Direction Enumerations"""
-    if port.direction == PortDir.INPUT:
-        return vckt.Port.Direction.INPUT
-    if port.direction == PortDir.OUTPUT:
-        return vckt.Port.Direction.OUTPUT
-    if port.direction == PortDir.INOUT:
-        return vckt.Port.Direction.INOUT
-    if port.direction == PortDir.NONE:
-        return vckt.Port.Direction.NONE
-    raise ValueError(f"Invalid PortDir {port.direction}")
+    pdir = _PORTDIR_MAP.get(port.direction, None)
+    if pdir is None:
+        raise ValueError(f"Invalid PortDir {port.direction}")
+    return pdir
 
 
 def export_connection_target(
@@ -312,10 +384,20 @@ def export_slice(slize: Slice) -> vckt.Slice:
 
 
 def export_concat(concat: Concat) -> vckt.Concat:
-    """Export (potentially recursive) Signal Concatenations"""
+    """Export (potentially nested) Signal Concatenations.
+    Nested `Concat`s are exported with an explicit work-stack, rather than by recursion.
+    Each is written in-place into its parent's `parts`, when it comes off the stack."""
     pconc = vckt.Concat()
-    for part in concat.parts:
-        pconc.parts.append(export_connection_target(part))
+    todo = [(concat, pconc)]
+    while todo:
+        conc, target = todo.pop()
+        for part in conc.parts:
+            ptarget = target.parts.add()
+            if isinstance(part, Concat):
+                ptarget.concat.SetInParent()
+                todo.append((part, ptarget.concat))
+            else:
+                ptarget.CopyFrom(export_connection_target(part))
     return pconc
 
 
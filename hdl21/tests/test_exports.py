@@ -272,6 +272,50 @@ def test_proto3():
     assert isinstance(inst.conns["p8"].parts[3], h.Slice)
 
 
+def test_export_nested_concat():
+    """Test exporting nested `Concat`s, which elaboration generally flattens out."""
+    from hdl21.proto.to_proto import export_concat
+
+    a = h.Signal(name="a", width=2)
+    b = h.Signal(name="b")
+    c = h.Signal(name="c", width=3)
+    pconc = export_concat(h.Concat(a, h.Concat(b, h.Concat(c[0:2], a)), c))
+
+    assert len(pconc.parts) == 3
+    assert pconc.parts[0].sig == "a"
+    assert pconc.parts[2].sig == "c"
+    inner = pconc.parts[1].concat
+    assert len(inner.parts) == 2
+    assert inner.parts[0].sig == "b"
+    innermost = inner.parts[1].concat
+    assert len(innermost.parts) == 2
+    assert innermost.parts[0].slice.signal == "c"
+    assert innermost.parts[0].slice.top == 1
+    assert innermost.parts[0].slice.bot == 0
+    assert innermost.parts[1].sig == "a"
+
+
+def test_export_equal_params_cached():
+    """Test that equal, but distinct, parameter-values share a single exported result."""
+    from hdl21.proto.to_proto import ProtoExporter
+
+    @h.module
+    class M:
+        z = h.Signal()
+        n1 = h.Mos(w=1, l=1)(d=z, g=z, s=z, b=z)
+        n2 = h.Mos(w=1, l=1)(d=z, g=z, s=z, b=z)
+        n3 = h.Mos(w=2, l=1)(d=z, g=z, s=z, b=z)
+
+    assert M.n1.of.params is not M.n2.of.params
+    exporter = ProtoExporter(tops=[h.elaborate(M)])
+    pkg = exporter.export()
+    assert len(exporter.params_cache) == 2
+
+    insts = pkg.modules[0].instances
+    assert insts[0].parameters == insts[1].parameters
+    assert insts[0].parameters != insts[2].parameters
+
+
 def test_proto_roundtrip():
     # Test protobuf round-tripping
 
@@ -304,6 +304,26 @@ def test_prim2():
     # FIXME: post-elab checks
 
 
+def test_prim_ports():
+    """Test that each library Primitive's `ports` are built once, in `port_list` order."""
+    from hdl21.primitives import _primitives
+
+    for entry in _primitives.values():
+        prim = entry.prim
+        assert prim.ports is prim.ports
+        assert list(prim.ports.values()) == prim.port_list
+
+    assert h.Mos().ports is h.Mos.ports
+
+    # Copies and re-assignments of `port_list` are reflected in `ports`
+    prim = copy.deepcopy(h.primitives.Mos)
+    assert list(prim.ports.values()) == prim.port_list
+    prim = copy.copy(h.primitives.Mos)
+    assert list(prim.ports.values()) == prim.port_list
+    prim.port_list = prim.port_list[:2]
+    assert list(prim.ports.values()) == prim.port_list
+
+
 def test_signal_slice1():
     # Initial test of signal slicing
 
@@ -1195,6 +1215,102 @@ def test_deep_hierarchy():
         h.elaborate(m)
 
 
+def test_hierarchy_deeper_than_recursion_limit():
+    """Test elaborating a hierarchy deeper than Python's recursion limit."""
+    import sys
+
+    prev = h.Module(name="M0")
+    prev.p = h.Port()
+    for k in range(sys.getrecursionlimit() + 100):
+        m = h.Module(name=f"M{k+1}")
+        m.p = h.Port()
+        m.i = h.Instance(of=prev)(p=m.p)
+        prev = m
+
+    h.elaborate(m)
+    assert m._elaborated is m
+
+
+def test_generated_hierarchy_deeper_than_recursion_limit():
+    """Test elaborating a chain of Generators deeper than Python's recursion limit."""
+    import sys
+
+    @h.paramclass
+    class P:
+        depth = h.Param(dtype=int, desc="Remaining depth")
+
+    @h.generator
+    def Chain(params: P) -> h.Module:
+        m = h.Module()
+        m.p = h.Port()
+        if params.depth > 0:
+            m.i = Chain(depth=params.depth - 1)(p=m.p)
+        return m
+
+    top = h.elaborate(Chain(depth=sys.getrecursionlimit() + 100))
+    assert isinstance(top, h.Module)
+    assert top.name == f"Chain(depth={sys.getrecursionlimit() + 100})"
+    assert top.i.of.name == f"Chain(depth={sys.getrecursionlimit() + 99})"
+
+
+def test_shared_module_elaborated_once():
+    """Test that a Module instantiated many times is elaborated once per pass."""
+    from hdl21.elab.elaborators.base import Elaborator
+
+    class Counter(Elaborator):
+        count = 0
+
+        def elaborate_module(self, module: h.Module) -> h.Module:
+            if module is Leaf:
+                Counter.count += 1
+            return module
+
+    @h.module
+    class Leaf:
+        p = h.Port()
+
+    @h.module
+    class Mid:
+        p = h.Port()
+        l1 = Leaf(p=p)
+        l2 = Leaf(p=p)
+
+    @h.module
+    class Top:
+        p = h.Port()
+        m1 = Mid(p=p)
+        m2 = Mid(p=p)
+
+    Counter.elaborate(tops=[Top], ctx=h.Context())
+    assert Counter.count == 1
+
+
+def test_recursive_instance_fails():
+    """Test that a Module which instantiates itself fails elaboration, rather than hanging."""
+
+    m = h.Module(name="m")
+    m.p = h.Port()
+    m.i = m(p=m.p)
+
+    with pytest.raises(RuntimeError, match="recursively instantiates itself"):
+        h.elaborate(m)
+
+
+def test_flatname():
+    """Test the `Elaborator.flatname` helper for creating non-colliding names."""
+    from hdl21.elab.elaborators.base import Elaborator
+
+    e = Elaborator(tops=[], ctx=h.Context())
+    assert e.flatname(["a", "b"]) == "a_b"
+    assert e.flatname(["a", "b"], avoid={"a_b": 1}) == "a_b_"
+    assert e.flatname(["a", "b"], avoid={"a_b", "a_b_"}) == "a_b__"
+    assert e.flatname(["a", "b"], avoid={"a_b", "a_b_"}, maxlen=5) == "a_b__"
+    with pytest.raises(RuntimeError):
+        e.flatname(["a", "b"], avoid={"a_b", "a_b_"}, maxlen=4)
+    with pytest.raises(RuntimeError):
+        e.flatname(["a", "b"], maxlen=2)
+
+
 def test_generator_eq():
     """Test equality and hashing of Generator calls using `Default`."""
 
@@ -13,9 +13,9 @@ as BSIM-CMG `.model` definitions. These are represented as (FIXME: ...)
 """
 
 import copy
-from typing import Union, Optional
+from typing import Optional
 from types import SimpleNamespace
-from dataclasses import asdict
+from dataclasses import fields
 
 from pydantic.dataclasses import dataclass
 
@@ -59,7 +59,9 @@ for tp, tpname in _mos_typenames.items():
             domain="asap7",
             name=modname,
             desc=f"ASAP7 PDK Mos {modname}",
-            port_list=copy.deepcopy(Mos.port_list),
+            # Each gets its own (shallow) copy of the Mos ports.
+            # `Signal` deep-copies are the same as shallow ones, sans the `deepcopy` memo machinery.
+            port_list=[copy.copy(p) for p in Mos.port_list],
             paramtype=dict,
         )
 
@@ -70,6 +72,11 @@ for tp, tpname in _mos_typenames.items():
         setattr(modules, modname, mod)
 
 
+# Names of the `MosParams` fields passed along to our `ExternalModule`s.
+# Everything but `vth`, which is instead encoded in the choice of `ExternalModule`.
+_mos_param_names = tuple(f.name for f in fields(MosParams) if f.name != "vth")
+
+
 class Asap7Walker(h.HierarchyWalker):
     """Hierarchical Walker, converting `h.Primitive` instances to process-defined `ExternalModule`s."""
 
@@ -105,8 +112,7 @@ class Asap7Walker(h.HierarchyWalker):
 
         # Translate its parameters
         # FIXME: further parameter transformations likely to come
-        modparams = asdict(params)
-        modparams.pop("vth", None)
+        modparams = {name: getattr(params, name) for name in _mos_param_names}
 
         # Combine the two into a call, cache and return it
         modcall = mod(modparams)
@@ -25,7 +25,6 @@ from hdl21.primitives import (
     Bipolar,
     ThreeTerminalResistor,
     ThreeTerminalCapacitor,
-    MosParams,
     PhysicalResistorParams,
     PhysicalCapacitorParams,
     DiodeParams,
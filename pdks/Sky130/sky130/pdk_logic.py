@@ -26,7 +26,8 @@ or added to this package via pull request.
 
 # Std-Lib Imports
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Any
 
 # PyPi Imports
 from pydantic.dataclasses import dataclass
@@ -53,6 +54,21 @@ from hdl21.primitives import (
 # Import relevant data from the PDK's data module
 from .pdk_data import *
 
+# Lookup table from (MosType, MosFamily, MosVth) to the first matching `xtors` module.
+# Built once at import-time, rather than by scanning `xtors` for each new set of `MosParams`.
+_MOS_MODULES: Dict[Tuple[MosType, MosFamily, MosVth], h.ExternalModule] = dict()
+for (_, _tp, _vth, _fam), _mod in xtors.items():
+    _MOS_MODULES.setdefault((_tp, _fam, _vth), _mod)
+
+# Model-library sections for each process corner
+_MOS_CORNERS: Mapping[h.pdk.Corner, str] = MappingProxyType(
+    {
+        h.pdk.Corner.TYP: "tt",
+        h.pdk.Corner.FAST: "ff",
+        h.pdk.Corner.SLOW: "ss",
+    }
+)
+
 
 @dataclass
 class Install(PdkInstallation):
@@ -91,17 +107,13 @@ class Install(PdkInstallation):
             ValueError: If an invalid process corner is provided.
         """
 
-        mos_corners: Dict[h.pdk.Corner, str] = {
-            h.pdk.Corner.TYP: "tt",
-            h.pdk.Corner.FAST: "ff",
-            h.pdk.Corner.SLOW: "ss",
-        }
-        if not isinstance(corner, h.pdk.Corner) or corner not in mos_corners:
-            raise ValueError(f"Invalid corner {corner}")
+        try:
+            section = _MOS_CORNERS[corner]
+        except (KeyError, TypeError):
+            # `TypeError` covers unhashable, non-`Corner` arguments
+            raise ValueError(f"Invalid corner {corner}") from None
 
-        return h.sim.Lib(
-            path=self.pdk_path / self.lib_path, section=mos_corners[corner]
-        )
+        return h.sim.Lib(path=self.pdk_path / self.lib_path, section=section)
 
     singleton: Optional["Install"] = None
 
@@ -128,28 +140,36 @@ class Sky130Walker(h.HierarchyWalker):
         self.cap_modcalls = dict()
         self.diode_modcalls = dict()
         self.bjt_modcalls = dict()
+        # Cache of visited Modules, keyed by `id(module)`
+        self._visited: Dict[int, h.Instantiable] = dict()
+
+        # Replacement methods, keyed by `Primitive`.
+        # All device-types are replaced in this single walk of the hierarchy.
+        self.replacements = {
+            Mos: self.mos_module_call,
+            PhysicalResistor: self.res_module_call,
+            ThreeTerminalResistor: self.res_module_call,
+            PhysicalCapacitor: self.cap_module_call,
+            ThreeTerminalCapacitor: self.cap_module_call,
+            Diode: self.diode_module_call,
+            Bipolar: self.bjt_module_call,
+        }
 
-    def visit_primitive_call(self, call: h.PrimitiveCall) -> h.Instantiable:
-        """Replace instances of `h.primitive.Mos` with our `ExternalModule`s"""
-        # Replace transistors
-        if call.prim is Mos:
-            return self.mos_module_call(call.params)
-
-        elif call.prim is PhysicalResistor or call.prim is ThreeTerminalResistor:
-            return self.res_module_call(call.params)
-
-        elif call.prim is PhysicalCapacitor or call.prim is ThreeTerminalCapacitor:
-            return self.cap_module_call(call.params)
-
-        elif call.prim is Diode:
-            return self.diode_module_call(call.params)
-
-        elif call.prim is Bipolar:
-            return self.bjt_module_call(call.params)
+    def visit_module(self, module: h.Module) -> h.Instantiable:
+        """Visit a `Module`, once per walker.
+        Shared Modules are commonly instantiated many times throughout a hierarchy."""
+        rv = self._visited.get(id(module), None)
+        if rv is None:
+            rv = self._visited[id(module)] = super().visit_module(module)
+        return rv
 
-        else:
+    def visit_primitive_call(self, call: h.PrimitiveCall) -> h.Instantiable:
+        """Replace instances of physical `h.Primitive`s with our `ExternalModule`s"""
+        replace = self.replacements.get(call.prim, None)
+        if replace is None:
             # Return everything else as-is
             return call
+        return replace(call.params)
 
     def mos_module(self, params: MosParams) -> h.ExternalModule:
         """Retrieve or create an `ExternalModule` for a MOS of parameters `params`."""
@@ -175,29 +195,12 @@ class Sky130Walker(h.HierarchyWalker):
         mostype = h.MosType.NMOS if params.tp is None else params.tp
         mosfam = h.MosFamily.CORE if params.family is None else params.family
         mosvth = h.MosVth.STD if params.vth is None else params.vth
-        args = (mostype, mosfam, mosvth)
-
-        # Find all the xtors that match the args
-        subset = {}
-        for k, v in xtors.items():
-
-            match = False
-            for a in args:
-                if a not in k:
-                    break
-            else:
-                match = True
-
-            if match:
-                subset[k] = v
-
-        # FIXME: Probably should be an error...
-        # if len(subset) > 2:
-        #     msg = f"Mos module choice not well-defined given parameters {args}"
-        #     raise RuntimeError(msg)
 
-        # Return the first one (supported as of 3.7)
-        return next(iter(subset.values()))
+        mod = _MOS_MODULES.get((mostype, mosfam, mosvth), None)
+        if mod is None:
+            msg = f"No Mos module for parameters {(mostype, mosfam, mosvth)}"
+            raise RuntimeError(msg)
+        return mod
 
     def mos_module_call(self, params: MosParams) -> h.ExternalModuleCall:
         """Retrieve or create a `Call` for MOS parameters `params`."""
@@ -408,6 +411,9 @@ def compile(src: h.Elaboratables) -> None:
     capacitors, diodes, and bipolar junction transistors with their respective Sky130 technology
     counterparts.
 
+    A list of `src` elaboratables is compiled by a single walker, in a single call.
+    Modules shared between them, e.g. a common DUT across several testbenches, are compiled once.
+
     Args:
         src (h.Elaboratables): The input source representing the circuit to be compiled
             into the Sample technology using the Sky130 process.
@@ -416,4 +422,4 @@ def compile(src: h.Elaboratables) -> None:
         None
     """
 
-    Sky130Walker().walk(src)
+    Sky130Walker().visit_elaboratables(src)
@@ -407,3 +407,65 @@ def test_walker_contents():
 
     content = walker_test_content()
     sky130.compile(content)
+
+
+def _shared_dut_content():
+    """Create a DUT with a single transistor, and two testbench-style modules which instantiate it."""
+
+    @h.module
+    class Dut:
+        z = h.Signal()
+        n = h.Mos()(d=z, g=z, s=z, b=z)
+
+    @h.module
+    class Tb1:
+        d1 = Dut()
+        d2 = Dut()
+
+    @h.module
+    class Tb2:
+        d = Dut()
+
+    return Dut, Tb1, Tb2
+
+
+class _CountingWalker(sky130.Sky130Walker):
+    """Walker which counts its visits to each `Instance`, keyed by `id`."""
+
+    def __init__(self):
+        super().__init__()
+        self.visits = dict()
+
+    def visit_instance(self, inst: h.Instance) -> h.Instance:
+        self.visits[id(inst)] = self.visits.get(id(inst), 0) + 1
+        return super().visit_instance(inst)
+
+
+def test_walker_visits_modules_once():
+    """Test that `Sky130Walker` visits each shared Module once."""
+
+    Dut, Tb1, _ = _shared_dut_content()
+    walker = _CountingWalker()
+    walker.visit_elaboratables(Tb1)
+
+    assert walker.visits[id(Dut.n)] == 1
+    assert isinstance(Dut.n.of, h.ExternalModuleCall)
+
+
+def test_compile_list_shares_modules(monkeypatch):
+    """Test that compiling a list of testbenches replaces their shared DUT's primitives once."""
+
+    Dut, Tb1, Tb2 = _shared_dut_content()
+    walkers = []
+
+    def new_walker():
+        walker = _CountingWalker()
+        walkers.append(walker)
+        return walker
+
+    monkeypatch.setattr(sky130, "Sky130Walker", new_walker)
+    sky130.compile([Tb1, Tb2])
+
+    assert len(walkers) == 1
+    assert walkers[0].visits[id(Dut.n)] == 1
+    assert isinstance(Dut.n.of, h.ExternalModuleCall)